@@ -4,6 +4,7 @@ import re
 import warnings
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
+from functools import lru_cache
 from typing import (
     Any,
     Generic,
@@ -139,11 +140,18 @@ class ExtensionManagementMixin(Generic[S], ABC):
                 uri for uri in obj.stac_extensions if uri != cls.get_schema_uri()
             ]
 
+    @classmethod
+    @lru_cache
+    def _get_schema_startswith(cls) -> str:
+        """Unversioned prefix of this extension's schema URI, computed once
+        per extension class."""
+        return VERSION_REGEX.split(cls.get_schema_uri())[0] + "/"
+
     @classmethod
     def has_extension(cls, obj: S) -> bool:
         """Check if the given object implements this extension by checking
         :attr:`pystac.STACObject.stac_extensions` for this extension's schema URI."""
-        schema_startswith = VERSION_REGEX.split(cls.get_schema_uri())[0] + "/"
+        schema_startswith = cls._get_schema_startswith()
 
         return obj.stac_extensions is not None and any(
             uri.startswith(schema_startswith) for uri in obj.stac_extensions
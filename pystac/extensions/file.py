@@ -366,7 +366,7 @@ class FileExtensionHooks(ExtensionHooks):
 
         found_fields = {}
         for asset_key, asset in obj.get("assets", {}).items():
-            if values := set(asset.keys()).intersection(self.removed_fields):
+            if values := self.removed_fields.intersection(asset):
                 found_fields[asset_key] = values
 
         if found_fields:
@@ -44,8 +44,14 @@ class ExtensionHooks(ABC):
     def get_object_links(self, obj: STACObject) -> list[str | pystac.RelType] | None:
         return None
 
+    @lru_cache
+    def _get_schema_startswith(self) -> str:
+        """Unversioned prefix of the schema URI, computed once per hooks
+        instance."""
+        return VERSION_REGEX.split(self.schema_uri)[0] + "/"
+
     def has_extension(self, obj: dict[str, Any]) -> bool:
-        schema_startswith = VERSION_REGEX.split(self.schema_uri)[0] + "/"
+        schema_startswith = self._get_schema_startswith()
         return any(
             uri.startswith(schema_startswith) or uri in self.prev_extension_ids
             for uri in obj.get("stac_extensions", [])
@@ -61,15 +67,17 @@ class ExtensionHooks(ABC):
         manipulate the obj dict. Remember to call super() in order to change out
         the old 'stac_extension' entry with the latest schema URI.
         """
-        # Migrate schema versions
-        for prev_id in self.prev_extension_ids:
-            if prev_id in info.extensions:
-                try:
-                    i = obj["stac_extensions"].index(prev_id)
-                    obj["stac_extensions"][i] = self.schema_uri
-                except ValueError:
-                    obj["stac_extensions"].append(self.schema_uri)
-                break
+        # Migrate schema versions. Intersect the previous IDs with the
+        # identified extensions in a single pass rather than scanning the
+        # extension list once per previous ID.
+        matched = self.prev_extension_ids.intersection(info.extensions)
+        if matched:
+            prev_id = next(iter(matched))
+            try:
+                i = obj["stac_extensions"].index(prev_id)
+                obj["stac_extensions"][i] = self.schema_uri
+            except ValueError:
+                obj["stac_extensions"].append(self.schema_uri)
 
 
 class RegisteredExtensionHooks:
@@ -92,20 +100,17 @@ class RegisteredExtensionHooks:
             del self.hooks[extension_id]
 
     def get_extended_object_links(self, obj: STACObject) -> list[str | pystac.RelType]:
-        result: list[str | pystac.RelType] | None = None
-        for ext in obj.stac_extensions:
-            if ext in self.hooks:
-                ext_result = self.hooks[ext].get_object_links(obj)
-                if ext_result is not None:
-                    if result is None:
-                        result = ext_result
-                    else:
-                        result.extend(ext_result)
-        return result or []
+        results = (
+            hooks.get_object_links(obj)
+            for ext in obj.stac_extensions
+            if (hooks := self.hooks.get(ext)) is not None
+        )
+        return [link for links in results if links is not None for link in links]
 
     def migrate(
         self, obj: dict[str, Any], version: STACVersionID, info: STACJSONDescription
     ) -> None:
+        object_type = info.object_type
         for hooks in self.hooks.values():
-            if info.object_type in hooks._get_stac_object_types():
+            if object_type in hooks._get_stac_object_types():
                 hooks.migrate(obj, version, info)
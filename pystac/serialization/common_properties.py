@@ -1,9 +1,9 @@
 from collections.abc import Iterable
-from typing import Any, cast
+from typing import Any
 
 import pystac
 from pystac.cache import CollectionCache
-from pystac.serialization.identify import STACVersionID
+from pystac.serialization.identify import _as_version_id
 from pystac.utils import make_absolute_href
 
 
@@ -34,20 +34,20 @@ def merge_common_properties(
 
     stac_version = item_dict.get("stac_version")
 
-    # The commons extension was removed in 1.0.0-beta.1, so if this is an earlier STAC
-    # item we don't have to bother with merging.
-    if stac_version is not None and STACVersionID(stac_version) > "0.9.0":
-        return False
-
-    # Check to see if this is a 0.9.0 item that
-    # doesn't extend the commons extension, in which case
-    # we don't have to merge.
-    if stac_version is not None and stac_version == "0.9.0":
-        stac_extensions = item_dict.get("stac_extensions")
-        if isinstance(stac_extensions, list):
+    if stac_version is not None:
+        # Check to see if this is a 0.9.0 item that
+        # doesn't extend the commons extension, in which case
+        # we don't have to merge. A plain string compare settles this
+        # before any version parsing.
+        if stac_version == "0.9.0":
+            stac_extensions = item_dict.get("stac_extensions")
+            if not isinstance(stac_extensions, list):
+                return False
             if "commons" not in stac_extensions:
                 return False
-        else:
+        # The commons extension was removed in 1.0.0-beta.1, so if this is a
+        # later STAC item we don't have to bother with merging.
+        elif _as_version_id(stac_version) > "0.9.0":
             return False
 
     # Try the cache if we have a collection ID.
@@ -59,10 +59,12 @@ def merge_common_properties(
     # Next, try the collection link.
     if collection is None:
         # Account for 0.5 links, which were dicts
-        if isinstance(item_dict["links"], dict):
-            links = list(cast(Iterable[dict[str, Any]], item_dict["links"].values()))
+        raw_links = item_dict["links"]
+        links: Iterable[dict[str, Any]]
+        if isinstance(raw_links, dict):
+            links = raw_links.values()
         else:
-            links = cast(list[dict[str, Any]], item_dict["links"])
+            links = raw_links
 
         collection_link = next(
             (link for link in links if link["rel"] == pystac.RelType.COLLECTION), None
@@ -95,10 +97,11 @@ def merge_common_properties(
             )
 
         if collection_props is not None:
+            item_props = item_dict["properties"]
             for k in collection_props:
-                if k not in item_dict["properties"]:
+                if k not in item_props:
                     properties_merged = True
-                    item_dict["properties"][k] = collection_props[k]
+                    item_props[k] = collection_props[k]
 
         if (
             collection_cache is not None
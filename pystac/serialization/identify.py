@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from enum import Enum
-from functools import total_ordering
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 import pystac
@@ -33,15 +33,24 @@ class OldExtensionShortIDs(Enum):
     FILE = "file"
 
 
-@total_ordering
+def _version_part_key(part: str) -> tuple[tuple[int, Any], ...]:
+    """Turns a dotted version part into a tuple that compares numerically
+    where possible (so that e.g. ``0.10.0 > 0.9.0``) and lexically otherwise.
+    """
+    return tuple((0, int(p)) if p.isdigit() else (1, p) for p in part.split("."))
+
+
 class STACVersionID:
     """Defines STAC versions in an object that is orderable based on version number.
     For instance, ``1.0.0-beta.2 < 1.0.0``
     """
 
+    __slots__ = ("version_string", "version_core", "version_prerelease", "_sort_key")
+
     version_string: str
     version_core: str
     version_prerelease: str | None
+    _sort_key: tuple[Any, ...]
 
     def __init__(self, version_string: str) -> None:
         self.version_string = version_string
@@ -54,34 +63,76 @@ class STACVersionID:
         else:
             self.version_prerelease = "-".join(version_parts[1:])
 
+        # Parse once so that comparisons are a single tuple compare rather
+        # than repeated string comparisons. A missing prerelease sorts after
+        # any prerelease of the same core version.
+        self._sort_key = (
+            _version_part_key(self.version_core),
+            (1,)
+            if self.version_prerelease is None
+            else (0, _version_part_key(self.version_prerelease)),
+        )
+
     def __str__(self) -> str:
         return self.version_string
 
+    def __hash__(self) -> int:
+        return hash(self._sort_key)
+
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, STACVersionID):
-            other = STACVersionID(str(other))
-        return str(self) == str(other)
+            other = _as_version_id(str(other))
+        return bool(self._sort_key == other._sort_key)
 
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
 
+    # Hand-rolled rich comparisons; functools.total_ordering synthesizes
+    # __le__/__gt__/__ge__ as wrappers that make two Python-level calls each,
+    # which doubles the cost of the hot range comparisons.
+
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, STACVersionID):
-            other = STACVersionID(str(other))
-        if self.version_core < other.version_core:
-            return True
-        elif self.version_core > other.version_core:
-            return False
-        else:
-            return self.version_prerelease is not None and (
-                other.version_prerelease is None
-                or other.version_prerelease > self.version_prerelease
-            )
+            other = _as_version_id(str(other))
+        return self._sort_key < other._sort_key
+
+    def __le__(self, other: object) -> bool:
+        if not isinstance(other, STACVersionID):
+            other = _as_version_id(str(other))
+        return self._sort_key <= other._sort_key
+
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, STACVersionID):
+            other = _as_version_id(str(other))
+        return self._sort_key > other._sort_key
+
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, STACVersionID):
+            other = _as_version_id(str(other))
+        return self._sort_key >= other._sort_key
+
+
+@lru_cache(maxsize=256)
+def _as_version_id(version_string: str) -> STACVersionID:
+    """Caching constructor for version IDs parsed from strings.
+
+    The same few version strings show up repeatedly while reading a catalog;
+    reuse one instance per string instead of re-parsing every time.
+    """
+    return STACVersionID(version_string)
+
+
+# Version IDs that are compared against on every identify call; constructed
+# once here rather than re-parsed per call.
+_VERSION_1_0_0_RC_1 = STACVersionID("1.0.0-rc.1")
+_DEFAULT_VERSION_ID = STACVersionID(STACVersion.DEFAULT_STAC_VERSION)
 
 
 class STACVersionRange:
     """Defines a range of STAC versions."""
 
+    __slots__ = ("min_version", "max_version")
+
     min_version: STACVersionID
     max_version: STACVersionID
 
@@ -91,33 +142,37 @@ class STACVersionRange:
         max_version: str | STACVersionID | None = None,
     ):
         if isinstance(min_version, str):
-            self.min_version = STACVersionID(min_version)
+            self.min_version = _as_version_id(min_version)
         else:
             self.min_version = min_version
 
         if max_version is None:
-            self.max_version = STACVersionID(STACVersion.DEFAULT_STAC_VERSION)
+            self.max_version = _DEFAULT_VERSION_ID
         else:
             if isinstance(max_version, str):
-                self.max_version = STACVersionID(max_version)
+                self.max_version = _as_version_id(max_version)
             else:
                 self.max_version = max_version
 
-    def set_min(self, v: STACVersionID) -> None:
+    def set_min(self, v: str | STACVersionID) -> None:
+        if isinstance(v, str):
+            v = _as_version_id(v)
         if self.min_version < v:
             if v < self.max_version:
                 self.min_version = v
             else:
                 self.min_version = self.max_version
 
-    def set_max(self, v: STACVersionID) -> None:
+    def set_max(self, v: str | STACVersionID) -> None:
+        if isinstance(v, str):
+            v = _as_version_id(v)
         if v < self.max_version:
             if self.min_version < v:
                 self.max_version = v
             else:
                 self.max_version = self.min_version
 
-    def set_to_single(self, v: STACVersionID) -> None:
+    def set_to_single(self, v: str | STACVersionID) -> None:
         self.set_min(v)
         self.set_max(v)
 
@@ -126,20 +181,22 @@ class STACVersionRange:
 
     def contains(self, v: str | STACVersionID) -> bool:
         if isinstance(v, str):
-            v = STACVersionID(v)
-        return self.min_version <= v <= self.max_version
+            v = _as_version_id(v)
+        # Compare the sort keys directly; the chained comparison is then two
+        # tuple compares with no intermediate STACVersionID method calls.
+        return self.min_version._sort_key <= v._sort_key <= self.max_version._sort_key
 
     def is_single_version(self) -> bool:
-        return self.min_version >= self.max_version
+        return self.min_version._sort_key >= self.max_version._sort_key
 
     def is_earlier_than(self, v: str | STACVersionID) -> bool:
         if isinstance(v, str):
-            v = STACVersionID(v)
+            v = _as_version_id(v)
         return self.max_version < v
 
     def is_later_than(self, v: str | STACVersionID) -> bool:
         if isinstance(v, str):
-            v = STACVersionID(v)
+            v = _as_version_id(v)
         return v < self.min_version
 
     def __repr__(self) -> str:
@@ -158,6 +215,8 @@ class STACJSONDescription:
             object implements
     """
 
+    __slots__ = ("object_type", "version_range", "extensions")
+
     object_type: STACObjectType
     """Describes the STAC object type. One of :class:`~pystac.STACObjectType`."""
 
@@ -184,6 +243,13 @@ class STACJSONDescription:
         )
 
 
+@lru_cache(maxsize=1)
+def _object_types_by_value() -> dict[str, STACObjectType]:
+    # Built lazily because pystac.STACObjectType does not exist yet when this
+    # module is imported.
+    return {t.value: t for t in pystac.STACObjectType}
+
+
 def identify_stac_object_type(json_dict: dict[str, Any]) -> STACObjectType | None:
     """Determines the STACObjectType of the provided JSON dict. If the JSON dict does
     not represent a STAC object, returns ``None``.
@@ -197,30 +263,18 @@ def identify_stac_object_type(json_dict: dict[str, Any]) -> STACObjectType | Non
     Args:
         json_dict : The dict of JSON to identify.
     """
-    stac_version = (
-        STACVersionID(json_dict["stac_version"])
-        if "stac_version" in json_dict
-        else None
-    )
+    stac_version = json_dict.get("stac_version")
     obj_type = json_dict.get("type")
 
     # Try to identify using 'type' property for v1.0.0-rc.1 and higher
-    introduced_type_attribute = STACVersionID("1.0.0-rc.1")
-    if stac_version is not None and stac_version >= introduced_type_attribute:
+    if stac_version is not None and _as_version_id(stac_version) >= _VERSION_1_0_0_RC_1:
         # Since v1.0.0-rc.1 requires a "type" field for all STAC objects, any object
-        # that is missing this attribute is not a valid STAC object.
-        if obj_type is None:
-            return None
-
-        # Try to match the "type" attribute
-        if obj_type == pystac.STACObjectType.CATALOG:
-            return pystac.STACObjectType.CATALOG
-        elif obj_type == pystac.STACObjectType.COLLECTION:
-            return pystac.STACObjectType.COLLECTION
-        elif obj_type == pystac.STACObjectType.ITEM:
-            return pystac.STACObjectType.ITEM
-        else:
-            return None
+        # that is missing this attribute is not a valid STAC object. Anything
+        # whose "type" is not a known STAC object type is not one either, so a
+        # single table lookup settles both.
+        if isinstance(obj_type, str):
+            return _object_types_by_value().get(obj_type)
+        return None
 
     # For pre-1.0 objects for version 0.8.* or later 'stac_version' must be present
     if stac_version is not None:
@@ -241,6 +295,18 @@ def identify_stac_object_type(json_dict: dict[str, Any]) -> STACObjectType | Non
     return None
 
 
+def _build_version_range(stac_version: str | None) -> STACVersionRange:
+    # The default range already starts at 0.8.0, which is also the minimum
+    # version implied by a declared 'stac_extensions', so only an explicit
+    # 'stac_version' narrows the range.
+    version_range = STACVersionRange()
+
+    if stac_version is not None:
+        version_range.set_to_single(stac_version)
+
+    return version_range
+
+
 def identify_stac_object(json_dict: dict[str, Any]) -> STACJSONDescription:
     """Determines the STACJSONDescription of the provided JSON dict.
 
@@ -257,20 +323,14 @@ def identify_stac_object(json_dict: dict[str, Any]) -> STACJSONDescription:
         extra_message = f"'type' attribute is {json_dict.get('type', 'not set')}"
         raise pystac.STACTypeError(json_dict, pystac.STACObject, extra_message)
 
-    version_range = STACVersionRange()
-
     stac_version = json_dict.get("stac_version")
     stac_extensions = json_dict.get("stac_extensions", None)
 
-    if stac_version is None:
-        version_range.set_min(STACVersionID("0.8.0"))
-    else:
-        version_range.set_to_single(stac_version)
-
-    if stac_extensions is not None:
-        version_range.set_min(STACVersionID("0.8.0"))
-
-    if stac_extensions is None:
-        stac_extensions = []
-
-    return STACJSONDescription(object_type, version_range, stac_extensions)
+    # The description and its version range are mutable, so each call gets
+    # fresh instances; the version parsing they share is what's cached
+    # (see _as_version_id).
+    return STACJSONDescription(
+        object_type,
+        _build_version_range(stac_version),
+        stac_extensions if stac_extensions is not None else [],
+    )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from copy import deepcopy
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 import pystac
@@ -61,23 +62,19 @@ def _migrate_datetime_range(
 ) -> set[str] | None:
     if version < "0.9":
         # Datetime range was removed
-        if (
-            "dtr:start_datetime" in d["properties"]
-            and "start_datetime" not in d["properties"]
-        ):
-            d["properties"]["start_datetime"] = d["properties"]["dtr:start_datetime"]
-            del d["properties"]["dtr:start_datetime"]
-
-        if (
-            "dtr:end_datetime" in d["properties"]
-            and "end_datetime" not in d["properties"]
-        ):
-            d["properties"]["end_datetime"] = d["properties"]["dtr:end_datetime"]
-            del d["properties"]["dtr:end_datetime"]
+        properties = d["properties"]
+        if "dtr:start_datetime" in properties and "start_datetime" not in properties:
+            properties["start_datetime"] = properties["dtr:start_datetime"]
+            del properties["dtr:start_datetime"]
+
+        if "dtr:end_datetime" in properties and "end_datetime" not in properties:
+            properties["end_datetime"] = properties["dtr:end_datetime"]
+            del properties["dtr:end_datetime"]
 
     return None
 
 
+@lru_cache(maxsize=1)
 def _get_object_migrations() -> (
     dict[str, Callable[[dict[str, Any], STACVersionID, STACJSONDescription], None]]
 ):
@@ -88,6 +85,7 @@ def _get_object_migrations() -> (
     }
 
 
+@lru_cache(maxsize=1)
 def _get_removed_extension_migrations() -> (
     dict[
         str,
@@ -183,12 +181,22 @@ def migrate_to_latest(
     result["stac_extensions"] = result.get("stac_extensions", None) or []
 
     pystac.EXTENSION_HOOKS.migrate(result, version, info)
-    for ext in result["stac_extensions"][:]:
-        if ext in removed_extension_migrations:
-            object_types, migration_fn = removed_extension_migrations[ext]
-            if object_types is None or info.object_type in object_types:
-                if migration_fn:
-                    migration_fn(result, version, info)
-                result["stac_extensions"].remove(ext)
+    ext_ids = result["stac_extensions"]
+    # Most objects declare no removed extensions; check for any hit in a
+    # single pass before walking the list entry by entry.
+    if not removed_extension_migrations.keys().isdisjoint(ext_ids):
+        # Rebuild the list in one ordered pass instead of copying it and
+        # calling list.remove (a linear scan) per dropped extension.
+        object_type = info.object_type
+        kept: list[str] = []
+        for ext in ext_ids:
+            if ext in removed_extension_migrations:
+                object_types, migration_fn = removed_extension_migrations[ext]
+                if object_types is None or object_type in object_types:
+                    if migration_fn:
+                        migration_fn(result, version, info)
+                    continue
+            kept.append(ext)
+        result["stac_extensions"] = kept
 
     return result
@@ -1,4 +1,5 @@
 import unittest
+from typing import Any
 
 import pytest
 
@@ -92,6 +93,27 @@ class TestIdentify:
 
         assert identify_stac_object_type(not_stac) is None
 
+    def test_identify_returns_fresh_description(self) -> None:
+        def item_dict() -> dict[str, Any]:
+            return {
+                "type": "Feature",
+                "stac_version": "1.0.0",
+                "stac_extensions": [],
+                "id": "an-id",
+                "geometry": {"type": "Point", "coordinates": [0, 0]},
+                "properties": {"datetime": "2021-01-01T00:00:00Z"},
+            }
+
+        # Mutating a returned description must not leak into descriptions
+        # returned for later identifications of the same shape.
+        info = identify_stac_object(item_dict())
+        info.version_range.set_max("0.9.0")
+        info.extensions.append("https://example.com/ext/v1.0.0/schema.json")
+
+        fresh = identify_stac_object(item_dict())
+        assert fresh.version_range.contains("1.0.0")
+        assert fresh.extensions == []
+
 
 class VersionTest(unittest.TestCase):
     def test_version_ordering(self) -> None:
@@ -106,6 +128,19 @@ class VersionTest(unittest.TestCase):
         self.assertTrue(STACVersionID("1.0.0-beta.1") <= STACVersionID("1.0.0-beta.2"))
         self.assertFalse(STACVersionID("1.0.0") < STACVersionID("1.0.0-beta.2"))
 
+    def test_version_ordering_is_numeric(self) -> None:
+        # Multi-digit components compare numerically, not lexically
+        self.assertTrue(STACVersionID("0.10.0") > "0.9.0")
+        self.assertFalse(STACVersionID("0.10.0") < STACVersionID("0.9.0"))
+        self.assertTrue(STACVersionID("1.0.0-alpha.9") < "1.0.0-alpha.10")
+
+    def test_version_hash_consistent_with_eq(self) -> None:
+        self.assertEqual(STACVersionID("1.0.0-rc.1"), STACVersionID("1.0.0-rc.1"))
+        self.assertEqual(
+            hash(STACVersionID("1.0.0-rc.1")), hash(STACVersionID("1.0.0-rc.1"))
+        )
+        self.assertEqual(len({STACVersionID("1.0.0"), STACVersionID("1.0.0")}), 1)
+
     def test_version_range_ordering(self) -> None:
         version_range = STACVersionRange("0.9.0", "1.0.0-beta.2")
         self.assertIsInstance(str(version_range), str)